@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# coding: utf-8
+#
+# Measure how long `import uiautomator2` takes in a fresh interpreter,
+# and make sure heavy dependencies are not loaded at import time.
+#
+# Usage: python examples/import_time.py [-n 20] [--max-ms 300]
+#
+
+from __future__ import print_function
+
+import argparse
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ['PIL', 'humanize', 'xml.dom.minidom', 'xml.etree.ElementTree']
+
+CHECK_CODE = '''
+import sys
+import uiautomator2
+loaded = [m for m in %r if m in sys.modules]
+if loaded:
+    sys.exit("loaded at import time: " + ", ".join(loaded))
+''' % (HEAVY_MODULES,)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', type=int, default=20, help='number of runs')
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='fail if the median import time exceeds this')
+    args = parser.parse_args()
+
+    subprocess.check_call([sys.executable, '-c', CHECK_CODE])
+
+    baseline, costs = [], []
+    for _ in range(args.n):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', 'pass'])
+        baseline.append(time.time() - start)
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', 'import uiautomator2'])
+        costs.append(time.time() - start)
+
+    median = lambda xs: sorted(xs)[len(xs)//2]
+    import_ms = (median(costs) - median(baseline)) * 1000
+    print("import uiautomator2: %.1f ms (median of %d runs)" % (import_ms, args.n))
+    if args.max_ms is not None and import_ms > args.max_ms:
+        sys.exit("import time %.1f ms exceeds limit %.1f ms" % (import_ms, args.max_ms))
+
+
+if __name__ == '__main__':
+    main()
@@ -9,13 +9,9 @@ import datetime
 import functools
 import json
 import io
-import xml.dom.minidom
-import xml.etree.ElementTree as ET
 import threading
 
 import six
-from PIL import Image
-import humanize
 from subprocess import list2cmdline
 
 if six.PY2:
@@ -202,6 +198,7 @@ class AutomatorServer(object):
         """
         r = self._reqsess.post(self.path2url('/install'), data={'url': url})
         id = r.text.strip()
+        import humanize # lazy import, only needed for progress output
         interval = 1.0 # 2.0s
         next_refresh = time.time()
         while True:
@@ -230,6 +227,7 @@ class AutomatorServer(object):
     def dump_hierarchy(self, compressed=False, pretty=False):
         content = self.jsonrpc.dumpWindowHierarchy(compressed, None)
         if pretty and "\n " not in content:
+            import xml.dom.minidom
             xml_text = xml.dom.minidom.parseString(content.encode("utf-8"))
             content = U(xml_text.toprettyxml(indent='  '))
         return content
@@ -377,6 +375,7 @@ class Session(object):
                 f.write(r.content)
             return filename
         else:
+            from PIL import Image # lazy import, PIL is slow to load
             buff = io.BytesIO(r.content)
             return Image.open(buff)
 
@@ -446,6 +445,7 @@ class Session(object):
         return self(**kwargs).exists
 
     def xpath_findall(self, xpath):
+        import xml.etree.ElementTree as ET
         xml = self.server.dump_hierarchy()
         root = ET.fromstring(xml)
         return root.findall(xpath)